@@ -14,15 +14,16 @@ from running_plan import (
 )
 from training_zones import TrainingZones, RaceTime
 from typing import List, Optional, Tuple, TYPE_CHECKING
+from collections.abc import Mapping
 from datetime import timedelta
 
 # Import workout library for session selection
 from workout_library import (
-    WorkoutLibrary,
     WorkoutCategory,
     TrainingPhase,
     AthleteLevel,
     get_workout_session,
+    get_workout_session_enum,
 )
 
 if TYPE_CHECKING:
@@ -71,9 +72,6 @@ class PlanGenerator:
         "domingo": "Sunday",
     }
 
-    # Workout library instance for session selection
-    _workout_library = WorkoutLibrary()
-
     # Mapping from workout types to library categories
     WORKOUT_TYPE_TO_CATEGORY = {
         "easy run": WorkoutCategory.EASY,
@@ -105,6 +103,12 @@ class PlanGenerator:
         "recovery": TrainingPhase.RECOVERY,
     }
 
+    LEVEL_TO_ENUM = {
+        "beginner": AthleteLevel.BEGINNER,
+        "intermediate": AthleteLevel.INTERMEDIATE,
+        "advanced": AthleteLevel.ADVANCED,
+    }
+
     @classmethod
     def _get_category_for_workout(cls, workout_type: str) -> Optional[WorkoutCategory]:
         """Map workout type string to WorkoutCategory."""
@@ -120,12 +124,7 @@ class PlanGenerator:
     @classmethod
     def _get_level_enum(cls, level: str) -> AthleteLevel:
         """Map level string to AthleteLevel enum."""
-        level_map = {
-            "beginner": AthleteLevel.BEGINNER,
-            "intermediate": AthleteLevel.INTERMEDIATE,
-            "advanced": AthleteLevel.ADVANCED,
-        }
-        return level_map.get(level.lower(), AthleteLevel.INTERMEDIATE)
+        return cls.LEVEL_TO_ENUM.get(level.lower(), AthleteLevel.INTERMEDIATE)
 
     @classmethod
     def _enrich_workout_with_session(
@@ -154,7 +153,7 @@ class PlanGenerator:
         level_enum = cls._get_level_enum(level)
         phase_enum = cls._get_phase_enum(phase)
 
-        session = cls._workout_library.select_session(
+        session = get_workout_session_enum(
             category=category,
             level=level_enum,
             phase=phase_enum,
@@ -786,7 +785,7 @@ class PlanGenerator:
             adjusted_workouts.append(workout)
 
         # Enforce desired easy-zone proportion if provided
-        desired_easy_share = zone_mix.get("easy") if isinstance(zone_mix, dict) else None
+        desired_easy_share = zone_mix.get("easy") if isinstance(zone_mix, Mapping) else None
         if desired_easy_share:
             total_distance = sum(getattr(w, "distance_km", 0) or 0 for w in adjusted_workouts if not is_rest(w))
             if total_distance > 0:
@@ -342,7 +342,17 @@ class WeeklyCheckIn:
     vdot_after_update: Optional[float] = None
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # All fields are scalars: a flat literal avoids asdict's recursive copy
+        return {
+            "week_number": self.week_number,
+            "energy_level": self.energy_level,
+            "muscle_soreness": self.muscle_soreness,
+            "sleep_hours": self.sleep_hours,
+            "motivation": self.motivation,
+            "notes": self.notes,
+            "fatigue_flag": self.fatigue_flag,
+            "vdot_after_update": self.vdot_after_update,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> "WeeklyCheckIn":
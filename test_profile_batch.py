@@ -0,0 +1,45 @@
+import pytest
+
+from user_profile import UserProfile, UserProfileBatch
+
+np = pytest.importorskip("numpy")
+
+
+def _profiles():
+    return [
+        UserProfile(weight_kg=70.0, height_cm=175.0, years_running=3, current_weekly_km=30),
+        UserProfile(
+            weight_kg=95.0,
+            height_cm=170.0,
+            years_running=1,
+            current_weekly_km=45,
+            current_injuries=["Fascite Plantar"],
+        ),
+        UserProfile(
+            weight_kg=60.0,
+            height_cm=160.0,
+            previous_injuries=["Fascite Plantar", "Tendinite Patelar", "Fratura por Estresse"],
+            current_injuries=["Tendinite de Aquiles"],
+        ),
+        UserProfile(),
+    ]
+
+
+def test_batch_matches_single_profile_bmi_and_risk():
+    profiles = _profiles()
+    batch = UserProfileBatch.from_profiles(profiles)
+
+    assert len(batch) == len(profiles)
+    assert batch.bmi().tolist() == [p.calculate_bmi() for p in profiles]
+    assert batch.risk_levels() == [p.get_injury_risk_level() for p in profiles]
+
+
+def test_batch_normalize_zone_mix_matches_get_zone_mix():
+    mixes = [(0.55, 0.25, 0.20), (2, 1, 1), (0, 0, 0)]
+
+    normalized = UserProfile.batch_normalize_zone_mix(mixes)
+
+    for row, (easy, tempo, interval) in zip(normalized, mixes):
+        profile = UserProfile(zone_mix_preference={"easy": easy, "tempo": tempo, "interval": interval})
+        expected = profile.get_zone_mix()
+        assert row.tolist() == pytest.approx([expected["easy"], expected["tempo"], expected["interval"]])
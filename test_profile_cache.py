@@ -0,0 +1,80 @@
+import copy
+import json
+import pickle
+
+from user_profile import UserProfile
+
+
+def _profile():
+    return UserProfile(name="Ana", weight_kg=70.0, height_cm=170.0, years_running=1, current_weekly_km=50.0)
+
+
+def test_reassigning_inputs_refreshes_derived_values():
+    profile = _profile()
+    assert profile.calculate_bmi() == 24.2
+    assert profile.get_injury_risk_level() == "Baixo"
+
+    profile.weight_kg = 90.0
+    profile.current_injuries = ["Fascite Plantar"]
+
+    assert profile.calculate_bmi() == 31.1
+    assert profile.get_injury_risk_level() == "Alto"
+
+
+def test_schedule_reads_reflect_in_place_edits():
+    profile = UserProfile(weekly_schedule={"Monday": [{"start": "06:00", "max_minutes": 60, "surfaces": ["pista"]}]})
+    assert profile.get_max_session_minutes("monday") == 60
+
+    profile.weekly_schedule["Monday"][0]["max_minutes"] = 20
+    profile.weekly_schedule["Monday"][0]["surfaces"].append("esteira")
+
+    assert profile.get_max_session_minutes("MONDAY") == 20
+    assert profile.get_surfaces_for_day("Monday") == ["pista", "esteira"]
+
+
+def test_in_place_injury_edits_are_seen():
+    profile = _profile()
+    assert profile.get_injury_risk_level() == "Baixo"
+
+    profile.current_injuries.append("Fascite Plantar")
+    profile.previous_injuries.append("Canelite (Periostite Tibial)")
+
+    assert profile.has_injury_history("Fascite Plantar")
+    assert profile.get_injury_risk_level() == "Alto"
+    needs_mod, reasons = profile.needs_modified_plan()
+    assert needs_mod and any("Fascite Plantar" in r for r in reasons)
+
+
+def test_in_place_preference_edits_are_seen():
+    profile = _profile()
+    assert profile.get_zone_mix()["interval"] == 0.2
+
+    profile.zone_mix_preference["interval"] = 2
+    profile.session_preferences["long_run"] = False
+
+    assert profile.get_zone_mix()["interval"] == round(2 / 2.8, 2)
+    assert profile.get_session_preferences()["long_run"] is False
+    json.dumps(profile.to_generator_params())
+
+
+def test_bmi_follows_in_place_and_copied_profiles():
+    profile = _profile()
+    assert profile.calculate_bmi() == 24.2
+
+    clone = copy.deepcopy(profile)
+    clone.height_cm = 180.0
+
+    assert clone.calculate_bmi() == 21.6
+    assert profile.calculate_bmi() == 24.2
+    assert pickle.loads(pickle.dumps(profile)).calculate_bmi() == 24.2
+
+
+def test_default_preferences_are_not_shared():
+    first = _profile()
+    first.zone_mix_preference["easy"] = 5.0
+    first.session_preferences["tempo"] = False
+
+    second = _profile()
+
+    assert second.zone_mix_preference["easy"] == 0.55
+    assert second.get_session_preferences()["tempo"] is True
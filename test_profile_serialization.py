@@ -0,0 +1,120 @@
+from dataclasses import fields
+from datetime import date, datetime
+
+import user_profile
+from user_profile import RaceGoal, UserProfile
+
+
+def _profile():
+    return UserProfile(
+        name="Maria",
+        age=31,
+        weight_kg=60.0,
+        height_cm=165.0,
+        main_race=RaceGoal(distance="21K", date=date(2026, 9, 6), name="Meia do Rio", is_main_goal=True),
+        test_races=[RaceGoal(distance="10K", date=date(2026, 7, 12))],
+        stressful_blocks={"Monday": ["evening"]},
+        weekly_schedule={"Tuesday": [{"start": "06:00", "end": "07:00", "max_minutes": 50, "surfaces": ["pista"]}]},
+        previous_injuries=["Fascite Plantar"],
+        created_date=datetime(2026, 1, 10, 8, 30),
+        last_updated=datetime(2026, 2, 1, 19, 0),
+    )
+
+
+def test_to_dict_covers_every_field_in_order():
+    data = _profile().to_dict()
+
+    assert list(data) == [f.name for f in fields(UserProfile) if f.init]
+    assert data["main_race"] == {
+        "distance": "21K",
+        "date": "2026-09-06",
+        "name": "Meia do Rio",
+        "location": "",
+        "is_main_goal": True,
+        "target_time": None,
+    }
+    assert data["test_races"][0]["date"] == "2026-07-12"
+    assert data["created_date"] == "2026-01-10T08:30:00"
+
+
+def test_to_dict_copies_containers():
+    profile = _profile()
+    data = profile.to_dict()
+
+    data["previous_injuries"].append("Tendinite Patelar")
+    data["stressful_blocks"]["Monday"].append("morning")
+    data["weekly_schedule"]["Tuesday"][0]["max_minutes"] = 10
+    data["weekly_schedule"]["Tuesday"][0]["surfaces"].append("trilha")
+
+    assert profile.previous_injuries == ["Fascite Plantar"]
+    assert profile.stressful_blocks == {"Monday": ["evening"]}
+    assert profile.get_max_session_minutes("Tuesday") == 50
+    assert profile.weekly_schedule["Tuesday"][0]["surfaces"] == ["pista"]
+
+
+def test_save_and_load_round_trip(tmp_path):
+    profile = _profile()
+    path = tmp_path / "perfil.json"
+
+    profile.save_to_file(str(path))
+    loaded = UserProfile.load_from_file(str(path))
+
+    assert loaded == profile
+    assert loaded.main_race == profile.main_race
+    assert loaded.get_injury_risk_level() == profile.get_injury_risk_level()
+
+
+def test_round_trip_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(user_profile, "_orjson", lambda: None)
+    profile = _profile()
+    path = tmp_path / "perfil.json"
+
+    profile.save_to_file(str(path))
+
+    assert UserProfile.load_from_file(str(path)) == profile
+
+
+def test_from_dict_fills_missing_fields_with_defaults():
+    profile = UserProfile.from_dict({
+        "name": "Maria",
+        "main_race": {"distance": "10K", "date": "2026-10-04"},
+        "created_date": "2026-01-10T08:30:00",
+    })
+
+    assert profile.name == "Maria"
+    assert profile.main_race == RaceGoal(distance="10K", date=date(2026, 10, 4))
+    assert profile.test_races == []
+    assert profile.zone_mix_preference == {"easy": 0.55, "tempo": 0.25, "interval": 0.20}
+    assert profile.created_date == datetime(2026, 1, 10, 8, 30)
+    assert isinstance(profile.last_updated, datetime)
+    assert profile.calculate_bmi() == 0.0
+
+
+def test_from_dict_accepts_null_test_races():
+    profile = UserProfile.from_dict({"name": "Maria", "test_races": None})
+
+    assert profile.test_races == []
+
+
+def test_race_goal_from_dict_defaults_optional_keys():
+    race = RaceGoal(distance="42K", date=date(2026, 11, 1), name="Maratona", target_time="3:45:00")
+
+    assert RaceGoal.from_dict(race.to_dict()) == race
+    assert RaceGoal.from_dict({"distance": "5K", "date": "2026-05-03"}) == RaceGoal(distance="5K", date=date(2026, 5, 3))
+
+
+def test_to_dict_keeps_null_periods_and_surfaces(tmp_path):
+    profile = UserProfile(
+        stressful_blocks={"Monday": None},
+        alternate_stressful_blocks={"Friday": None},
+        weekly_schedule={"Tuesday": [{"start": "06:00", "surfaces": None}]},
+    )
+
+    data = profile.to_dict()
+    assert data["stressful_blocks"] == {"Monday": None}
+    assert data["alternate_stressful_blocks"] == {"Friday": None}
+    assert data["weekly_schedule"]["Tuesday"] == [{"start": "06:00", "surfaces": None}]
+
+    path = tmp_path / "perfil.json"
+    profile.save_to_file(str(path))
+    assert UserProfile.load_from_file(str(path)) == profile
@@ -0,0 +1,28 @@
+from training_zones import RaceTime, TrainingZones
+
+
+def _zones(method="jack_daniels"):
+    tz = TrainingZones(method=method)
+    tz.add_race_time("5K", RaceTime.from_time_string(5.0, "22:30"))
+    tz.add_race_time("10K", RaceTime.from_time_string(10.0, "47:15"))
+    tz.calculate_zones()
+    return tz
+
+
+def test_table_follows_reassigned_and_edited_zones():
+    tz = _zones()
+    tz.to_table()
+
+    tz.zones = {name: (300.0, 330.0) for name in tz.zones}
+    assert tz.to_table().count("5:00 - 5:30") == len(tz.zones)
+
+    tz.zones["easy"] = (360.0, 390.0)
+    assert "6:00 - 6:30" in tz.to_table()
+
+
+def test_table_lists_every_zone_for_both_methods():
+    for method in ("jack_daniels", "critical_velocity"):
+        tz = _zones(method)
+        table = tz.to_table()
+        for name in tz.zones:
+            assert tz.get_zone_pace_range_str(name) in table
@@ -0,0 +1,127 @@
+import copy
+import json
+import os
+import pickle
+import subprocess
+import sys
+from dataclasses import asdict
+from itertools import product
+
+import pytest
+
+from workout_library import (
+    AthleteLevel,
+    TrainingPhase,
+    WorkoutCategory,
+    WorkoutLibrary,
+    get_sessions,
+    workout_library,
+)
+
+
+def _naive_suitable(category, level, phase):
+    levels = [AthleteLevel.BEGINNER, AthleteLevel.INTERMEDIATE, AthleteLevel.ADVANCED]
+    return [
+        s for s in workout_library.get_sessions(category)
+        if levels.index(level) >= levels.index(s.min_level) and phase in s.phases
+    ]
+
+
+def test_index_matches_linear_filtering():
+    for category, level, phase in product(WorkoutCategory, AthleteLevel, TrainingPhase):
+        expected = _naive_suitable(category, level, phase)
+        assert list(get_sessions(level, phase, category)) == expected
+        assert list(workout_library.get_suitable_sessions(category, level, phase)) == expected
+
+
+def test_index_without_category_spans_all_categories():
+    for level, phase in product(AthleteLevel, TrainingPhase):
+        expected = [s for c in workout_library.sessions for s in _naive_suitable(c, level, phase)]
+        assert list(get_sessions(level, phase)) == expected
+
+
+def test_phases_accept_lists_and_are_frozen():
+    session = workout_library.get_session_by_id("easy_01")
+    assert isinstance(session.phases, frozenset)
+    assert session.is_suitable_for(AthleteLevel.BEGINNER, TrainingPhase.BASE)
+
+
+def test_select_session_falls_back_to_category_when_all_suitable_excluded():
+    category, level, phase = WorkoutCategory.INTERVAL, AthleteLevel.BEGINNER, TrainingPhase.BUILD
+    suitable_ids = {s.id for s in workout_library.get_suitable_sessions(category, level, phase)}
+    remaining_ids = {s.id for s in workout_library.get_sessions(category)} - suitable_ids
+
+    picks = {workout_library.select_session(category, level, phase, exclude_ids=suitable_ids).id for _ in range(50)}
+    assert picks <= remaining_ids
+
+    every_id = suitable_ids | remaining_ids
+    assert workout_library.select_session(category, level, phase, exclude_ids=every_id) is None
+
+
+def test_round_robin_cycles_through_suitable_sessions():
+    library = WorkoutLibrary()
+    category, level, phase = WorkoutCategory.INTERVAL, AthleteLevel.ADVANCED, TrainingPhase.PEAK
+    pool = library.get_suitable_sessions(category, level, phase)
+
+    picks = [library.select_session_round_robin(category, level, phase) for _ in range(2 * len(pool))]
+
+    assert picks == list(pool) * 2
+
+
+def test_first_session_matches_candidate_order():
+    for category, level, phase in product(WorkoutCategory, AthleteLevel, TrainingPhase):
+        suitable = workout_library.get_suitable_sessions(category, level, phase)
+        expected = suitable[0] if suitable else next(iter(workout_library.get_sessions(category)), None)
+        assert workout_library.select_first_session(category, level, phase) is expected
+
+        if suitable:
+            excluded = {s.id for s in suitable}
+            fallback = [s for s in workout_library.get_sessions(category) if s.id not in excluded]
+            first = workout_library.select_first_session(category, level, phase, exclude_ids=excluded)
+            assert first is (fallback[0] if fallback else None)
+
+
+def test_numpy_bulk_filter_matches_index():
+    pytest.importorskip("numpy")
+    for level, phase in product(AthleteLevel, TrainingPhase):
+        assert workout_library.find_across_categories(level, phase) == get_sessions(level, phase)
+
+
+def test_sessions_copy_and_serialize():
+    session = workout_library.get_session_by_id("interval_01")
+
+    assert copy.deepcopy(session) == session
+    assert pickle.loads(pickle.dumps(session)) == session
+    assert list(asdict(session)["structure"]) == [dict(segment) for segment in session.structure]
+    assert json.loads(json.dumps(session.structure[0])) == session.structure[0]
+
+
+def test_session_summary_is_a_plain_copy():
+    summary = workout_library.get_session_summary()
+
+    assert summary == {c.value: len(s) for c, s in workout_library.sessions.items()}
+    assert json.loads(json.dumps(summary)) == summary
+    assert pickle.loads(pickle.dumps(copy.deepcopy(summary))) == summary
+
+    summary.clear()
+    assert workout_library.get_session_summary()
+
+
+def test_library_copies_and_pickles():
+    clone = copy.deepcopy(workout_library)
+    restored = pickle.loads(pickle.dumps(workout_library))
+
+    for library in (clone, restored):
+        assert library.sessions == workout_library.sessions
+        assert library.get_session_summary() == workout_library.get_session_summary()
+
+
+def test_indices_are_built_on_first_lookup():
+    code = (
+        "import workout_library as w\n"
+        "assert not w._ALL_SESSIONS and not w._SUITABLE_INDEX\n"
+        "assert isinstance(w.workout_library, w.WorkoutLibrary)\n"
+        "assert w.workout_library.get_session_by_id('easy_01').id == 'easy_01'\n"
+        "assert w._ALL_SESSIONS and w._SUITABLE_INDEX\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
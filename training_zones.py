@@ -9,6 +9,65 @@ from typing import Dict, Optional, Tuple
 import math
 
 
+ZONE_ORDER = ('easy', 'marathon', 'threshold', 'interval', 'repetition')
+
+# Zone emojis and metadata used by ``TrainingZones.to_table``
+ZONE_TABLE_INFO = {
+    'easy': {
+        'emoji': '🟢',
+        'name': 'Easy/Recovery',
+        'hr_range': '65-75%',
+        'uso': 'Regeneração, base aeróbica'
+    },
+    'marathon': {
+        'emoji': '🔵',
+        'name': 'Marathon Pace',
+        'hr_range': '75-84%',
+        'uso': 'Resistência aeróbica'
+    },
+    'threshold': {
+        'emoji': '🟡',
+        'name': 'Threshold/Tempo',
+        'hr_range': '84-88%',
+        'uso': 'Limiar anaeróbico'
+    },
+    'interval': {
+        'emoji': '🟠',
+        'name': 'Interval/5K',
+        'hr_range': '95-98%',
+        'uso': 'VO2max'
+    },
+    'repetition': {
+        'emoji': '🔴',
+        'name': 'Repetition/Fast',
+        'hr_range': '98-100%',
+        'uso': 'Velocidade máxima'
+    }
+}
+
+_TABLE_TITLE = (
+    "\n" + "="*80 + "\n"
+    "🏃‍♂️ SUAS ZONAS DE TREINAMENTO (JACK DANIELS)\n"
+    + "="*80 + "\n\n"
+)
+
+_TABLE_HEADER = (
+    "┌" + "─"*78 + "┐\n"
+    f"│ {'Zona':<20} │ {'Emoji':<6} │ {'Pace/km':<14} │ {'% FCMax':<9} │ {'Uso':<20} │\n"
+    "├" + "─"*78 + "┤\n"
+)
+
+_TABLE_FOOTER = (
+    "└" + "─"*78 + "┘\n"
+    "\n💡 Dicas de uso:\n"
+    "  • 🟢 Easy: 70-80% do volume semanal\n"
+    "  • 🔵 Marathon: Treinos longos e ritmo de prova\n"
+    "  • 🟡 Threshold: 1-2x por semana, máx 60min total\n"
+    "  • 🟠 Interval: 1x por semana, séries curtas\n"
+    "  • 🔴 Repetition: Ocasional, velocidade pura\n\n"
+)
+
+
 class RaceTime:
     """Represents a race time for a specific distance."""
 
@@ -94,6 +153,8 @@ class TrainingZones:
         self.vdot: Optional[float] = None
         self.race_times: Dict[str, RaceTime] = {}
         self.update_log = []
+        self._table_rows: Dict[str, str] = {}  # zone_name -> pre-formatted to_table row
+        self._table_zones: Dict[str, Tuple[float, float]] = {}  # zones the cached rows were built from
 
     @staticmethod
     def _distance_from_label(label: str) -> float:
@@ -147,6 +208,9 @@ class TrainingZones:
         if not self.race_times:
             raise ValueError("No race times provided")
 
+        self._table_rows = {}
+        self._table_zones = {}
+
         if self.method == 'jack_daniels':
             self._calculate_jack_daniels_zones()
         elif self.method == 'critical_velocity':
@@ -288,6 +352,8 @@ class TrainingZones:
 
             self.zones[zone_name] = (min_pace, max_pace)
 
+        self._build_table_rows()
+
     def _calculate_critical_velocity_zones(self):
         """Calculate training zones using Critical Velocity method."""
         # Need at least 2 race times
@@ -413,70 +479,31 @@ class TrainingZones:
 
         return result
 
+    def _build_table_rows(self) -> Dict[str, str]:
+        """Pre-format the ``to_table`` row of every computed zone and cache them."""
+        rows = {}
+        for zone_name in ZONE_ORDER:
+            if zone_name in self.zones:
+                info = ZONE_TABLE_INFO[zone_name]
+                pace_range = self.get_zone_pace_range_str(zone_name)
+                rows[zone_name] = f"│ {info['emoji']} {info['name']:<17} │ {info['emoji']:<6} │ {pace_range:<14} │ {info['hr_range']:<9} │ {info['uso']:<20} │\n"
+        self._table_rows = rows
+        self._table_zones = dict(self.zones)
+        return rows
+
     def to_table(self) -> str:
         """
         Generate a visual table of training zones with emojis.
         Returns a formatted string that can be printed.
         """
-        # Zone emojis and metadata
-        zone_info = {
-            'easy': {
-                'emoji': '🟢',
-                'name': 'Easy/Recovery',
-                'hr_range': '65-75%',
-                'uso': 'Regeneração, base aeróbica'
-            },
-            'marathon': {
-                'emoji': '🔵',
-                'name': 'Marathon Pace',
-                'hr_range': '75-84%',
-                'uso': 'Resistência aeróbica'
-            },
-            'threshold': {
-                'emoji': '🟡',
-                'name': 'Threshold/Tempo',
-                'hr_range': '84-88%',
-                'uso': 'Limiar anaeróbico'
-            },
-            'interval': {
-                'emoji': '🟠',
-                'name': 'Interval/5K',
-                'hr_range': '95-98%',
-                'uso': 'VO2max'
-            },
-            'repetition': {
-                'emoji': '🔴',
-                'name': 'Repetition/Fast',
-                'hr_range': '98-100%',
-                'uso': 'Velocidade máxima'
-            }
-        }
+        # Rows are cached when zones are computed; rebuild if any pace changed since
+        rows = self._table_rows
+        if self._table_zones != self.zones:
+            rows = self._build_table_rows()
 
-        result = "\n" + "="*80 + "\n"
-        result += "🏃‍♂️ SUAS ZONAS DE TREINAMENTO (JACK DANIELS)\n"
-        result += "="*80 + "\n\n"
+        result = _TABLE_TITLE
 
         if self.vdot:
             result += f"💪 VDOT: {self.vdot:.1f}\n\n"
 
-        result += "┌" + "─"*78 + "┐\n"
-        result += f"│ {'Zona':<20} │ {'Emoji':<6} │ {'Pace/km':<14} │ {'% FCMax':<9} │ {'Uso':<20} │\n"
-        result += "├" + "─"*78 + "┤\n"
-
-        for zone_name in ['easy', 'marathon', 'threshold', 'interval', 'repetition']:
-            if zone_name in self.zones:
-                info = zone_info[zone_name]
-                pace_range = self.get_zone_pace_range_str(zone_name)
-
-                result += f"│ {info['emoji']} {info['name']:<17} │ {info['emoji']:<6} │ {pace_range:<14} │ {info['hr_range']:<9} │ {info['uso']:<20} │\n"
-
-        result += "└" + "─"*78 + "┘\n"
-
-        result += "\n💡 Dicas de uso:\n"
-        result += "  • 🟢 Easy: 70-80% do volume semanal\n"
-        result += "  • 🔵 Marathon: Treinos longos e ritmo de prova\n"
-        result += "  • 🟡 Threshold: 1-2x por semana, máx 60min total\n"
-        result += "  • 🟠 Interval: 1x por semana, séries curtas\n"
-        result += "  • 🔴 Repetition: Ocasional, velocidade pura\n\n"
-
-        return result
+        return result + _TABLE_HEADER + "".join(rows.values()) + _TABLE_FOOTER
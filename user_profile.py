@@ -3,13 +3,169 @@ User Profile module for Running Plan Creator.
 Stores comprehensive user information for personalized training plans.
 """
 from datetime import datetime, date
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
 from copy import deepcopy
-import json
-
-
-@dataclass
+from functools import lru_cache
+from bisect import bisect_right
+import sys
+
+# orjson is optional: faster (de)serialization, stdlib json otherwise.
+# Both are imported on first save/load so importing this module stays cheap.
+@lru_cache(maxsize=1)
+def _orjson():
+    """Return the orjson module, or None when it is not installed."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _write_json(filename: str, data: Dict):
+    """Write ``data`` as indented UTF-8 JSON (same bytes with orjson or json)."""
+    orjson = _orjson()
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    import json
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _read_json(filename: str) -> Dict:
+    """Read a JSON file with orjson when available."""
+    orjson = _orjson()
+    if orjson is not None:
+        with open(filename, 'rb') as f:
+            return orjson.loads(f.read())
+    import json
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+_RULE = "=" * 70
+_PROFILE_HEADER = f"\n{_RULE}\n👤 PERFIL DO ATLETA\n{_RULE}\n"
+_PROFILE_FOOTER = f"{_RULE}\n"
+
+# Sentinel default for the UserProfile timestamps
+_UNSET = object()
+
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Common injury list for reference
+COMMON_INJURIES: Tuple[str, ...] = (
+    "Fascite Plantar",
+    "Canelite (Periostite Tibial)",
+    "Síndrome da Banda Iliotibial",
+    "Tendinite Patelar",
+    "Tendinite de Aquiles",
+    "Fratura por Estresse",
+    "Condromalácia Patelar",
+    "Síndrome do Piriforme",
+    "Bursite Trocantérica",
+    "Estiramento Muscular (Posterior de Coxa)",
+)
+
+SECONDARY_OBJECTIVES_OPTIONS: Tuple[str, ...] = (
+    "Performance/Tempo",
+    "Saúde Geral",
+    "Perda de Peso",
+    "Manutenção de Peso",
+    "Bem-estar Mental",
+    "Socialização",
+    "Desafio Pessoal",
+    "Qualificação para Prova",
+)
+
+EQUIPMENT_OPTIONS: Tuple[str, ...] = (
+    "Relógio GPS/Smartwatch",
+    "Monitor de Frequência Cardíaca",
+    "Acesso a Pista de Atletismo",
+    "Esteira",
+    "Rolo de Massagem/Foam Roller",
+    "Faixas de Resistência",
+    "Academia",
+)
+
+TOLERATED_WORKOUT_OPTIONS: Tuple[str, ...] = (
+    "Corridas fáceis/rodagens",
+    "Intervalos curtos",
+    "Intervalos longos",
+    "Tempo run",
+    "Fartlek",
+    "Longões progressivos",
+    "Treino de trilha/terreno variado",
+)
+
+# Default preference templates: private and never mutated (each profile gets
+# its own dict copy). Plain dicts, so the copy and the {**a, **b} merge take
+# the dict fast path.
+_ZONE_MIX_DEFAULT = {
+    "easy": 0.55,
+    "tempo": 0.25,
+    "interval": 0.20,
+}
+
+_SESSION_PREFS_DEFAULT = {
+    "intervals": True,
+    "tempo": True,
+    "long_run": True,
+    "cross_training": False,
+}
+
+# Column order used by UserProfile.batch_normalize_zone_mix
+ZONE_MIX_KEYS: Tuple[str, ...] = ("easy", "tempo", "interval")
+
+# Plan modification triggered by a previous injury (checked in this order)
+_INJURY_MODIFIER_MESSAGES = {
+    "Canelite (Periostite Tibial)": "Histórico de canelite - reduzir volume inicial",
+    "Fascite Plantar": "Histórico de fascite - incluir mais descanso",
+}
+
+# Starting weekly volume (km) by experience level when no volume is known
+_LEVEL_DEFAULT_VOLUME_KM = {"beginner": 20.0, "intermediate": 30.0, "advanced": 40.0}
+
+# Category thresholds (lower bound inclusive): label = LABELS[bisect_right(CUTS, value)]
+_BMI_CUTS = (18.5, 25, 30)
+_BMI_LABELS = ("Abaixo do peso", "Peso normal", "Sobrepeso", "Obesidade")
+
+_RISK_CUTS = (3, 5)
+_RISK_LABELS = ("Baixo", "Moderado", "Alto")
+
+
+def _injury_risk_score(has_current: bool, n_previous: int, bmi: float,
+                       years_running: float, current_km: float) -> int:
+    """Injury risk score as a single arithmetic expression (no branches)."""
+    return (
+        3 * has_current                                   # Current injuries
+        + 2 * (n_previous > 2)                            # Multiple previous injuries
+        + 2 * (bmi > 28)                                  # High BMI
+        + 2 * (years_running < 2 and current_km > 40)     # Low experience with high volume
+    )
+
+
+@lru_cache(maxsize=256)
+def _tanaka_hr_max(age: int) -> int:
+    """Estimated max heart rate, Tanaka formula: 208 - (0.7 × age)."""
+    return int(208 - (0.7 * age))
+
+
+# Race dates repeat across profiles and re-exports; timestamps are unique per
+# save (last_updated is reset every time), so only dates are memoized
+@lru_cache(maxsize=2048)
+def _date_iso(d: date) -> str:
+    return d.isoformat()
+
+
+def _list_or_none(values):
+    # Empty periods may be stored as None (asdict kept them as-is)
+    return None if values is None else list(values)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class RaceGoal:
     """Represents a race goal (main or test race)."""
     distance: str  # "5K", "10K", "Half Marathon", "Marathon"
@@ -22,7 +178,7 @@ class RaceGoal:
     def to_dict(self) -> Dict:
         return {
             "distance": self.distance,
-            "date": self.date.isoformat(),
+            "date": _date_iso(self.date),
             "name": self.name,
             "location": self.location,
             "is_main_goal": self.is_main_goal,
@@ -31,12 +187,36 @@ class RaceGoal:
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'RaceGoal':
-        data_copy = data.copy()
-        data_copy['date'] = date.fromisoformat(data['date'])
-        return cls(**data_copy)
+        return cls(
+            distance=data["distance"],
+            date=date.fromisoformat(data["date"]),
+            name=data.get("name", ""),
+            location=data.get("location", ""),
+            is_main_goal=data.get("is_main_goal", False),
+            target_time=data.get("target_time"),
+        )
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ScheduleBlock:
+    """Typed, read-only view of one ``weekly_schedule`` time block."""
+    start: str = ""  # "HH:MM"
+    end: str = ""
+    max_minutes: Optional[int] = None
+    surfaces: Tuple[str, ...] = ()  # "pista", "esteira", "trilha", ...
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ScheduleBlock':
+        max_minutes = data.get('max_minutes')
+        return cls(
+            start=data.get('start', ''),
+            end=data.get('end', ''),
+            max_minutes=int(max_minutes) if max_minutes else None,
+            surfaces=tuple(data.get('surfaces') or ()),
+        )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class UserProfile:
     """Comprehensive user profile for personalized training."""
 
@@ -90,11 +270,7 @@ class UserProfile:
     # Training Zones (Recent Race Times)
     recent_race_times: Dict[str, str] = field(default_factory=dict)  # {"5K": "22:30", "10K": "47:15"}
     zones_calculation_method: str = "jack_daniels"  # "jack_daniels" or "critical_velocity"
-    zone_mix_preference: Dict[str, float] = field(default_factory=lambda: {
-        "easy": 0.55,
-        "tempo": 0.25,
-        "interval": 0.20,
-    })
+    zone_mix_preference: Dict[str, float] = field(default_factory=_ZONE_MIX_DEFAULT.copy)
     vdot_estimate: Optional[float] = None
 
     # Heart Rate (optional)
@@ -103,12 +279,7 @@ class UserProfile:
 
     # Training structure preferences
     initial_weekly_km: Optional[float] = None
-    session_preferences: Dict[str, bool] = field(default_factory=lambda: {
-        "intervals": True,
-        "tempo": True,
-        "long_run": True,
-        "cross_training": False,
-    })
+    session_preferences: Dict[str, bool] = field(default_factory=_SESSION_PREFS_DEFAULT.copy)
 
     # Injury History
     previous_injuries: List[str] = field(default_factory=list)
@@ -125,83 +296,51 @@ class UserProfile:
     feedback_required: bool = True  # Solicitar feedback frequente para ajustes
 
     # Metadata
-    created_date: datetime = field(default_factory=datetime.now)
-    last_updated: datetime = field(default_factory=datetime.now)
-
-    # Common injury list for reference
-    COMMON_INJURIES = [
-        "Fascite Plantar",
-        "Canelite (Periostite Tibial)",
-        "Síndrome da Banda Iliotibial",
-        "Tendinite Patelar",
-        "Tendinite de Aquiles",
-        "Fratura por Estresse",
-        "Condromalácia Patelar",
-        "Síndrome do Piriforme",
-        "Bursite Trocantérica",
-        "Estiramento Muscular (Posterior de Coxa)"
-    ]
-
-    SECONDARY_OBJECTIVES_OPTIONS = [
-        "Performance/Tempo",
-        "Saúde Geral",
-        "Perda de Peso",
-        "Manutenção de Peso",
-        "Bem-estar Mental",
-        "Socialização",
-        "Desafio Pessoal",
-        "Qualificação para Prova"
-    ]
-
-    EQUIPMENT_OPTIONS = [
-        "Relógio GPS/Smartwatch",
-        "Monitor de Frequência Cardíaca",
-        "Acesso a Pista de Atletismo",
-        "Esteira",
-        "Rolo de Massagem/Foam Roller",
-        "Faixas de Resistência",
-        "Academia"
-    ]
-
-    TOLERATED_WORKOUT_OPTIONS = [
-        "Corridas fáceis/rodagens",
-        "Intervalos curtos",
-        "Intervalos longos",
-        "Tempo run",
-        "Fartlek",
-        "Longões progressivos",
-        "Treino de trilha/terreno variado"
-    ]
+    created_date: datetime = _UNSET  # set to datetime.now() in __post_init__ when omitted
+    last_updated: datetime = _UNSET
+
+    # Memoized BMI, keyed on the (weight_kg, height_cm) it was computed from
+    _bmi_cache: Optional[Tuple[float, float, float]] = field(default=None, init=False, repr=False, compare=False)
+
+    # Option lists (module-level constants, re-exposed for UserProfile.X access)
+    COMMON_INJURIES = COMMON_INJURIES
+    SECONDARY_OBJECTIVES_OPTIONS = SECONDARY_OBJECTIVES_OPTIONS
+    EQUIPMENT_OPTIONS = EQUIPMENT_OPTIONS
+    TOLERATED_WORKOUT_OPTIONS = TOLERATED_WORKOUT_OPTIONS
+
+    def __post_init__(self):
+        # One clock read shared by both timestamps (skipped when both are given, e.g. on load)
+        if self.created_date is _UNSET or self.last_updated is _UNSET:
+            now = datetime.now()
+            if self.created_date is _UNSET:
+                self.created_date = now
+            if self.last_updated is _UNSET:
+                self.last_updated = now
 
     def calculate_bmi(self) -> float:
         """Calculate Body Mass Index."""
-        if self.weight_kg > 0 and self.height_cm > 0:
-            height_m = self.height_cm / 100
-            return round(self.weight_kg / (height_m ** 2), 1)
-        return 0.0
+        weight, height = self.weight_kg, self.height_cm
+        cached = self._bmi_cache
+        if cached is not None and cached[0] == weight and cached[1] == height:
+            return cached[2]
+        if weight > 0 and height > 0:
+            height_m = height / 100
+            bmi = round(weight / (height_m ** 2), 1)
+        else:
+            bmi = 0.0
+        self._bmi_cache = (weight, height, bmi)
+        return bmi
 
     def get_bmi_category(self) -> str:
         """Get BMI category."""
         bmi = self.calculate_bmi()
         if bmi == 0:
             return "Não calculado"
-        elif bmi < 18.5:
-            return "Abaixo do peso"
-        elif bmi < 25:
-            return "Peso normal"
-        elif bmi < 30:
-            return "Sobrepeso"
-        else:
-            return "Obesidade"
+        return _BMI_LABELS[bisect_right(_BMI_CUTS, bmi)]
 
     def estimate_hr_max(self) -> int:
         """Estimate maximum heart rate if not provided."""
-        if self.hr_max:
-            return self.hr_max
-        if self.age > 0:
-            # Using Tanaka formula: 208 - (0.7 × age)
-            return int(208 - (0.7 * self.age))
-        return 0
+        return self.hr_max or (_tanaka_hr_max(self.age) if self.age > 0 else 0)
 
     def get_initial_volume_km(self) -> float:
         """Return starting weekly volume used by the plan generator."""
@@ -210,8 +349,7 @@ class UserProfile:
         if self.current_weekly_km > 0:
             return round(self.current_weekly_km * 1.1, 1)
         # Fallback based on experience level
-        level_defaults = {"beginner": 20.0, "intermediate": 30.0, "advanced": 40.0}
-        return level_defaults.get(self.experience_level, 20.0)
+        return _LEVEL_DEFAULT_VOLUME_KM.get(self.experience_level, 20.0)
 
     def get_weekly_time_budget(self) -> float:
         """Calculate total weekly time budget in hours."""
@@ -219,19 +357,33 @@ class UserProfile:
 
     def get_zone_mix(self) -> Dict[str, float]:
         """Return normalized training zone mix preferences."""
-        mix = {**self.zone_mix_preference}
+        mix = self.zone_mix_preference
         total = sum(mix.values()) or 1.0
         return {zone: round(value / total, 2) for zone, value in mix.items()}
 
+    @classmethod
+    def batch_normalize_zone_mix(cls, mixes):
+        """
+        Normalize many zone mixes at once (vectorized counterpart of get_zone_mix).
+
+        Args:
+            mixes: (N, 3) array-like of weights ordered as ZONE_MIX_KEYS
+                   (easy, tempo, interval)
+
+        Returns:
+            (N, 3) float32 numpy array with each row summing to ~1, rounded to 2 decimals
+        """
+        import numpy as np  # only needed for batch analytics
+
+        mixes = np.array(mixes, dtype=np.float32, ndmin=2)
+        totals = mixes.sum(axis=1, keepdims=True)
+        totals[totals == 0] = 1.0
+        np.divide(mixes, totals, out=mixes)
+        return np.round(mixes, 2, out=mixes)
+
     def get_session_preferences(self) -> Dict[str, bool]:
         """Return session-type selections with sensible defaults."""
-        defaults = {
-            "intervals": True,
-            "tempo": True,
-            "long_run": True,
-            "cross_training": False,
-        }
-        combined = {**defaults, **self.session_preferences}
+        combined = {**_SESSION_PREFS_DEFAULT, **self.session_preferences}
         # If injury risk is high, automatically reduce intensity
         if self.get_injury_risk_level() == "Alto":
             combined["intervals"] = False
@@ -250,36 +402,19 @@ class UserProfile:
 
     def has_injury_history(self, injury_type: str) -> bool:
         """Check if user has history of specific injury."""
+        # Injury lists are short and edited in place, so they are read live
         return injury_type in self.previous_injuries or injury_type in self.current_injuries
 
     def get_injury_risk_level(self) -> str:
-        """Assess overall injury risk level."""
-        risk_score = 0
-
-        # Current injuries increase risk
-        if self.current_injuries:
-            risk_score += 3
-
-        # Multiple previous injuries
-        if len(self.previous_injuries) > 2:
-            risk_score += 2
-
-        # High BMI increases risk
-        bmi = self.calculate_bmi()
-        if bmi > 28:
-            risk_score += 2
-
-        # Low experience with high volume
-        if self.years_running < 2 and self.current_weekly_km > 40:
-            risk_score += 2
-
-        # Determine risk level
-        if risk_score >= 5:
-            return "Alto"
-        elif risk_score >= 3:
-            return "Moderado"
-        else:
-            return "Baixo"
+        """Assess overall injury risk level (injuries, BMI and training load)."""
+        risk_score = _injury_risk_score(
+            bool(self.current_injuries),
+            len(self.previous_injuries),
+            self.calculate_bmi(),
+            self.years_running,
+            self.current_weekly_km,
+        )
+        return _RISK_LABELS[bisect_right(_RISK_CUTS, risk_score)]
 
     def get_recommended_days_per_week(self) -> int:
         """Get recommended training days based on profile."""
@@ -290,36 +425,44 @@ class UserProfile:
         else:  # advanced
             return self.days_per_week
 
-    def get_day_schedule(self, day: str) -> List[Dict[str, object]]:
+    def get_day_schedule(self, day: str) -> Sequence[Dict[str, object]]:
         """Return time blocks for a given day name (case-insensitive)."""
-        normalized_day = day.capitalize()
-        return self.weekly_schedule.get(normalized_day, self.weekly_schedule.get(day, []))
+        # Read live: the schedule dicts are edited in place by the widgets
+        schedule = self.weekly_schedule
+        blocks = schedule.get(day)
+        if blocks is None:
+            wanted = day.casefold()
+            blocks = next((v for k, v in schedule.items() if k.casefold() == wanted), ())
+        return blocks
+
+    def get_schedule_blocks(self, day: str) -> Tuple['ScheduleBlock', ...]:
+        """Return the day's time blocks as typed ScheduleBlock records (case-insensitive)."""
+        return tuple(ScheduleBlock.from_dict(b) for b in self.get_day_schedule(day))
 
     def get_max_session_minutes(self, day: str) -> Optional[int]:
         """Return the most restrictive max session duration for the day."""
-        blocks = self.get_day_schedule(day)
-        max_values = [b.get('max_minutes') for b in blocks if b.get('max_minutes')]
-        if max_values:
-            return min(int(v) for v in max_values)
+        # Hot path (once per workout): read the block dicts directly, no ScheduleBlock objects
+        limits = [int(v) for b in self.get_day_schedule(day) if (v := b.get('max_minutes'))]
+        if limits:
+            return min(limits)
         if self.hours_per_day:
             return int(self.hours_per_day * 60)
         return None
 
     def get_surfaces_for_day(self, day: str) -> List[str]:
         """Return available surfaces for the day (from schedule or preferences)."""
-        blocks = self.get_day_schedule(day)
-        surfaces = []
-        for block in blocks:
-            surfaces.extend(block.get('surfaces', []))
+        surfaces: List[str] = []
+        for block in self.get_day_schedule(day):
+            # Short lists: a linear "not in" beats building a dict to deduplicate
+            for surface in block.get('surfaces') or ():
+                if surface and surface not in surfaces:
+                    surfaces.append(surface)
         # Fallback to general preference
-        if not surfaces and self.preferred_location:
-            surfaces.extend(self.preferred_location)
-        # Normalize and deduplicate
-        normalized = []
-        for surface in surfaces:
-            if surface and surface not in normalized:
-                normalized.append(surface)
-        return normalized
+        if not surfaces:
+            for surface in self.preferred_location:
+                if surface and surface not in surfaces:
+                    surfaces.append(surface)
+        return surfaces
 
     def needs_modified_plan(self) -> Tuple[bool, List[str]]:
         """
@@ -333,11 +476,9 @@ class UserProfile:
         if self.current_injuries:
             modifications.append(f"Lesões atuais: {', '.join(self.current_injuries)}")
 
-        if "Canelite (Periostite Tibial)" in self.previous_injuries:
-            modifications.append("Histórico de canelite - reduzir volume inicial")
-
-        if "Fascite Plantar" in self.previous_injuries:
-            modifications.append("Histórico de fascite - incluir mais descanso")
+        for injury, message in _INJURY_MODIFIER_MESSAGES.items():
+            if injury in self.previous_injuries:
+                modifications.append(message)
 
         if self.calculate_bmi() > 28:
             modifications.append("IMC elevado - progressão mais gradual")
@@ -358,23 +499,73 @@ class UserProfile:
 
     def to_dict(self) -> Dict:
         """Convert profile to dictionary for serialization."""
-        data = asdict(self)
-
-        # Convert dates to ISO format
-        if self.main_race:
-            data['main_race'] = self.main_race.to_dict()
-
-        data['test_races'] = [race.to_dict() for race in self.test_races]
-        data['created_date'] = self.created_date.isoformat()
-        data['last_updated'] = self.last_updated.isoformat()
-
-        return data
+        # Explicit field list with shallow container copies (asdict deep-copies everything)
+        return {
+            "name": self.name,
+            "age": self.age,
+            "weight_kg": self.weight_kg,
+            "height_cm": self.height_cm,
+            "gender": self.gender,
+            "years_running": self.years_running,
+            "current_weekly_km": self.current_weekly_km,
+            "average_weekly_km": self.average_weekly_km,
+            "recent_peak_weekly_km": self.recent_peak_weekly_km,
+            "consistent_days_per_week": self.consistent_days_per_week,
+            "tolerated_workouts": list(self.tolerated_workouts),
+            "adherence_score": self.adherence_score,
+            "experience_level": self.experience_level,
+            "main_race": self.main_race.to_dict() if self.main_race else None,
+            "test_races": [race.to_dict() for race in self.test_races],
+            "secondary_objectives": list(self.secondary_objectives),
+            "days_per_week": self.days_per_week,
+            "hours_per_day": self.hours_per_day,
+            "preferred_time": self.preferred_time,
+            "preferred_location": list(self.preferred_location),
+            "preferred_days": list(self.preferred_days),
+            "stressful_blocks": {day: _list_or_none(periods) for day, periods in self.stressful_blocks.items()},
+            "long_run_preference_days": list(self.long_run_preference_days),
+            "use_alternating_weeks": self.use_alternating_weeks,
+            "alternate_stressful_blocks": {day: _list_or_none(periods) for day, periods in self.alternate_stressful_blocks.items()},
+            "alternate_long_run_days": list(self.alternate_long_run_days),
+            "weekly_schedule": {
+                day: [
+                    {**block, "surfaces": list(block["surfaces"])} if block.get("surfaces") is not None else dict(block)
+                    for block in blocks
+                ]
+                for day, blocks in self.weekly_schedule.items()
+            },
+            "default_warmup_minutes": self.default_warmup_minutes,
+            "default_cooldown_minutes": self.default_cooldown_minutes,
+            "commute_minutes": self.commute_minutes,
+            "typical_key_workout_rpe": self.typical_key_workout_rpe,
+            "long_session_tolerance": self.long_session_tolerance,
+            "variety_preference": self.variety_preference,
+            "social_training_options": list(self.social_training_options),
+            "routine_vs_fun_balance": self.routine_vs_fun_balance,
+            "recent_race_times": dict(self.recent_race_times),
+            "zones_calculation_method": self.zones_calculation_method,
+            "zone_mix_preference": dict(self.zone_mix_preference),
+            "vdot_estimate": self.vdot_estimate,
+            "hr_resting": self.hr_resting,
+            "hr_max": self.hr_max,
+            "initial_weekly_km": self.initial_weekly_km,
+            "session_preferences": dict(self.session_preferences),
+            "previous_injuries": list(self.previous_injuries),
+            "current_injuries": list(self.current_injuries),
+            "injury_triggers": list(self.injury_triggers),
+            "red_zones": list(self.red_zones),
+            "available_equipment": list(self.available_equipment),
+            "strength_routines": list(self.strength_routines),
+            "impact_limitations": list(self.impact_limitations),
+            "feedback_required": self.feedback_required,
+            "created_date": self.created_date.isoformat(),
+            "last_updated": self.last_updated.isoformat(),
+        }
 
     def save_to_file(self, filename: str):
         """Save profile to JSON file."""
         self.last_updated = datetime.now()
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        _write_json(filename, self.to_dict())
 
     def clone_with_updates(self, **updates) -> 'UserProfile':
         """Create an editable clone of the profile, applying provided updates."""
@@ -390,188 +581,250 @@ class UserProfile:
     @classmethod
     def load_from_file(cls, filename: str) -> 'UserProfile':
         """Load profile from JSON file."""
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        return cls.from_dict(_read_json(filename))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'UserProfile':
+        """Build a profile from a ``to_dict()`` dictionary (missing keys use field defaults)."""
+        data = dict(data)
 
         # Reconstruct race goals
         if data.get('main_race'):
             data['main_race'] = RaceGoal.from_dict(data['main_race'])
 
-        if data.get('test_races'):
-            data['test_races'] = [RaceGoal.from_dict(race) for race in data['test_races']]
+        if 'test_races' in data:
+            data['test_races'] = [RaceGoal.from_dict(race) for race in data['test_races'] or ()]
 
-        # Reconstruct dates
-        data['created_date'] = datetime.fromisoformat(data['created_date'])
-        data['last_updated'] = datetime.fromisoformat(data['last_updated'])
+        # Reconstruct dates (missing/null timestamps are filled in by __post_init__)
+        for key in ('created_date', 'last_updated'):
+            if data.get(key):
+                data[key] = datetime.fromisoformat(data[key])
+            else:
+                data.pop(key, None)
 
         return cls(**data)
 
     def __str__(self):
         """String representation of user profile."""
-        result = "\n" + "="*70 + "\n"
-        result += "👤 PERFIL DO ATLETA\n"
-        result += "="*70 + "\n"
+        # Derived values are resolved once up front; the body below only formats
+        bmi = self.calculate_bmi()
+        hr_max = self.estimate_hr_max()
+        needs_mod, mods = self.needs_modified_plan()
+
+        parts = [_PROFILE_HEADER]
 
         # Personal info
         if self.name:
-            result += f"Nome: {self.name}\n"
+            parts.append(f"Nome: {self.name}\n")
         if self.age:
-            result += f"Idade: {self.age} anos\n"
+            parts.append(f"Idade: {self.age} anos\n")
         if self.weight_kg and self.height_cm:
-            bmi = self.calculate_bmi()
-            result += f"Peso: {self.weight_kg}kg | Altura: {self.height_cm}cm | IMC: {bmi} ({self.get_bmi_category()})\n"
+            parts.append(f"Peso: {self.weight_kg}kg | Altura: {self.height_cm}cm | IMC: {bmi} ({self.get_bmi_category()})\n")
 
         # Experience
-        result += f"\n📊 Experiência: {self.years_running} anos correndo\n"
-        result += f"Nível: {self.experience_level.capitalize()}\n"
-        result += f"Kilometragem semanal atual: {self.current_weekly_km}km\n"
+        parts.append(
+            f"\n📊 Experiência: {self.years_running} anos correndo\n"
+            f"Nível: {self.experience_level.capitalize()}\n"
+            f"Kilometragem semanal atual: {self.current_weekly_km}km\n"
+        )
         if self.average_weekly_km:
-            result += f"Volume médio recente: {self.average_weekly_km}km/sem\n"
+            parts.append(f"Volume médio recente: {self.average_weekly_km}km/sem\n")
         if self.recent_peak_weekly_km:
-            result += f"Pico recente: {self.recent_peak_weekly_km}km/sem\n"
+            parts.append(f"Pico recente: {self.recent_peak_weekly_km}km/sem\n")
         if self.consistent_days_per_week:
-            result += f"Dias mantidos por semana: {self.consistent_days_per_week}\n"
+            parts.append(f"Dias mantidos por semana: {self.consistent_days_per_week}\n")
         if self.tolerated_workouts:
-            result += f"Treinos já tolerados: {', '.join(self.tolerated_workouts)}\n"
+            parts.append(f"Treinos já tolerados: {', '.join(self.tolerated_workouts)}\n")
         if self.adherence_score is not None:
-            result += f"Aderência histórica: {self.adherence_score}%\n"
+            parts.append(f"Aderência histórica: {self.adherence_score}%\n")
 
         # Goals
         if self.main_race:
-            result += f"\n🎯 Prova Principal: {self.main_race.distance}"
+            parts.append(f"\n🎯 Prova Principal: {self.main_race.distance}")
             if self.main_race.name:
-                result += f" - {self.main_race.name}"
-            result += f"\n   Data: {self.main_race.date.strftime('%d/%m/%Y')}"
+                parts.append(f" - {self.main_race.name}")
+            parts.append(f"\n   Data: {self.main_race.date.strftime('%d/%m/%Y')}")
             if self.main_race.target_time:
-                result += f" | Meta: {self.main_race.target_time}"
-            result += "\n"
+                parts.append(f" | Meta: {self.main_race.target_time}")
+            parts.append("\n")
 
         if self.test_races:
-            result += f"\n📝 Provas Teste:\n"
+            parts.append("\n📝 Provas Teste:\n")
             for race in self.test_races:
-                result += f"   • {race.distance} em {race.date.strftime('%d/%m/%Y')}"
+                parts.append(f"   • {race.distance} em {race.date.strftime('%d/%m/%Y')}")
                 if race.name:
-                    result += f" - {race.name}"
-                result += "\n"
+                    parts.append(f" - {race.name}")
+                parts.append("\n")
 
         if self.secondary_objectives:
-            result += f"\n💡 Objetivos Secundários: {', '.join(self.secondary_objectives)}\n"
+            parts.append(f"\n💡 Objetivos Secundários: {', '.join(self.secondary_objectives)}\n")
 
         # Availability
-        result += f"\n⏰ Disponibilidade: {self.days_per_week} dias/semana"
-        result += f" | {self.hours_per_day}h/dia (Total: {self.get_weekly_time_budget()}h/semana)\n"
+        parts.append(
+            f"\n⏰ Disponibilidade: {self.days_per_week} dias/semana"
+            f" | {self.hours_per_day}h/dia (Total: {self.get_weekly_time_budget()}h/semana)\n"
+        )
         if self.preferred_time:
-            result += f"Horário preferido: {self.preferred_time}\n"
+            parts.append(f"Horário preferido: {self.preferred_time}\n")
         if self.preferred_location:
-            result += f"Local preferido: {', '.join(self.preferred_location)}\n"
+            parts.append(f"Local preferido: {', '.join(self.preferred_location)}\n")
         if self.stressful_blocks:
-            result += "Blocos de alto estresse (evitar treinos-chave):\n"
+            parts.append("Blocos de alto estresse (evitar treinos-chave):\n")
             for day, periods in self.stressful_blocks.items():
-                label = f"   • {day}"
-                if periods:
-                    label += f" ({', '.join(periods)})"
-                result += label + "\n"
+                parts.append(f"   • {day} ({', '.join(periods)})\n" if periods else f"   • {day}\n")
         if self.long_run_preference_days:
-            result += f"Dias com mais tempo para longões: {', '.join(self.long_run_preference_days)}\n"
+            parts.append(f"Dias com mais tempo para longões: {', '.join(self.long_run_preference_days)}\n")
         if self.use_alternating_weeks:
-            result += "Agenda alternada (semanas A/B): ativa\n"
+            parts.append("Agenda alternada (semanas A/B): ativa\n")
             if self.alternate_stressful_blocks:
-                result += "  Semana B - blocos críticos: "
-                formatted = [f"{day} ({', '.join(periods)})" if periods else day for day, periods in self.alternate_stressful_blocks.items()]
-                result += ", ".join(formatted) + "\n"
+                parts.append("  Semana B - blocos críticos: ")
+                parts.append(", ".join(
+                    f"{day} ({', '.join(periods)})" if periods else day
+                    for day, periods in self.alternate_stressful_blocks.items()
+                ))
+                parts.append("\n")
             if self.alternate_long_run_days:
-                result += f"  Semana B - longão preferido: {', '.join(self.alternate_long_run_days)}\n"
+                parts.append(f"  Semana B - longão preferido: {', '.join(self.alternate_long_run_days)}\n")
 
         if self.weekly_schedule:
-            result += "Grade semanal:\n"
+            parts.append("Grade semanal:\n")
             for day, blocks in self.weekly_schedule.items():
                 for block in blocks:
                     start = block.get('start', '')
                     end = block.get('end', '')
                     max_minutes = block.get('max_minutes')
                     surfaces = ", ".join(block.get('surfaces', []))
-                    block_str = f"   • {day}: {start}-{end}" if start or end else f"   • {day}"
+                    parts.append(f"   • {day}: {start}-{end}" if start or end else f"   • {day}")
                     if max_minutes:
-                        block_str += f" | Máx: {max_minutes}min"
+                        parts.append(f" | Máx: {max_minutes}min")
                     if surfaces:
-                        block_str += f" | Acessos: {surfaces}"
-                    result += block_str + "\n"
+                        parts.append(f" | Acessos: {surfaces}")
+                    parts.append("\n")
 
         # Training preferences
-        if any([
-            self.typical_key_workout_rpe,
-            self.long_session_tolerance,
-            self.variety_preference,
-            self.social_training_options,
-            self.routine_vs_fun_balance
-        ]):
-            result += "\n🎛️ Preferências de Treino:\n"
+        if (
+            self.typical_key_workout_rpe
+            or self.long_session_tolerance
+            or self.variety_preference
+            or self.social_training_options
+            or self.routine_vs_fun_balance
+        ):
+            parts.append("\n🎛️ Preferências de Treino:\n")
             if self.typical_key_workout_rpe:
-                result += f"   RPE típico em treinos-chave: {self.typical_key_workout_rpe}/10\n"
+                parts.append(f"   RPE típico em treinos-chave: {self.typical_key_workout_rpe}/10\n")
             if self.long_session_tolerance:
-                result += f"   Tolerância a sessões longas: {self.long_session_tolerance}\n"
+                parts.append(f"   Tolerância a sessões longas: {self.long_session_tolerance}\n")
             if self.variety_preference:
-                result += f"   Preferência por variedade: {self.variety_preference}\n"
+                parts.append(f"   Preferência por variedade: {self.variety_preference}\n")
             if self.social_training_options:
-                result += f"   Treinos sociais possíveis: {', '.join(self.social_training_options)}\n"
+                parts.append(f"   Treinos sociais possíveis: {', '.join(self.social_training_options)}\n")
             if self.routine_vs_fun_balance:
-                result += f"   Estilo (rotina vs diversão): {self.routine_vs_fun_balance}\n"
+                parts.append(f"   Estilo (rotina vs diversão): {self.routine_vs_fun_balance}\n")
 
         # Training zones
         if self.recent_race_times:
-            result += f"\n🏃 Tempos Recentes:\n"
+            parts.append("\n🏃 Tempos Recentes:\n")
             for distance, time in self.recent_race_times.items():
-                result += f"   • {distance}: {time}\n"
-            result += f"Método de cálculo: {self.zones_calculation_method}\n"
+                parts.append(f"   • {distance}: {time}\n")
+            parts.append(f"Método de cálculo: {self.zones_calculation_method}\n")
         if self.vdot_estimate:
-            result += f"Estimativa de VDOT (Jack Daniels): {self.vdot_estimate:.1f}\n"
+            parts.append(f"Estimativa de VDOT (Jack Daniels): {self.vdot_estimate:.1f}\n")
 
         # Heart rate
         if self.hr_resting or self.hr_max:
-            result += f"\n❤️  Frequência Cardíaca:\n"
+            parts.append("\n❤️  Frequência Cardíaca:\n")
             if self.hr_resting:
-                result += f"   Repouso: {self.hr_resting} bpm\n"
-            hr_max = self.estimate_hr_max()
+                parts.append(f"   Repouso: {self.hr_resting} bpm\n")
             if hr_max:
-                result += f"   Máxima: {hr_max} bpm"
+                parts.append(f"   Máxima: {hr_max} bpm")
                 if not self.hr_max:
-                    result += " (estimada)"
-                result += "\n"
+                    parts.append(" (estimada)")
+                parts.append("\n")
 
         # Injuries
         if self.previous_injuries or self.current_injuries:
-            result += f"\n🩹 Histórico de Lesões:\n"
+            parts.append("\n🩹 Histórico de Lesões:\n")
             if self.current_injuries:
-                result += f"   Lesões Atuais: {', '.join(self.current_injuries)}\n"
+                parts.append(f"   Lesões Atuais: {', '.join(self.current_injuries)}\n")
             if self.previous_injuries:
-                result += f"   Lesões Prévias: {', '.join(self.previous_injuries)}\n"
+                parts.append(f"   Lesões Prévias: {', '.join(self.previous_injuries)}\n")
             if self.injury_triggers:
-                result += f"   Gatilhos a evitar: {', '.join(self.injury_triggers)}\n"
+                parts.append(f"   Gatilhos a evitar: {', '.join(self.injury_triggers)}\n")
             if self.red_zones:
-                result += f"   Zonas Vermelhas (sobrecarga): {', '.join(self.red_zones)}\n"
-            result += f"   Nível de Risco: {self.get_injury_risk_level()}\n"
+                parts.append(f"   Zonas Vermelhas (sobrecarga): {', '.join(self.red_zones)}\n")
+            parts.append(f"   Nível de Risco: {self.get_injury_risk_level()}\n")
 
         # Equipment
         if self.available_equipment:
-            result += f"\n🔧 Equipamentos: {', '.join(self.available_equipment)}\n"
+            parts.append(f"\n🔧 Equipamentos: {', '.join(self.available_equipment)}\n")
 
         # Prevention / Strength routines
         if self.strength_routines:
-            result += f"\n🏋️  Força/Prevenção em uso: {', '.join(self.strength_routines)}\n"
+            parts.append(f"\n🏋️  Força/Prevenção em uso: {', '.join(self.strength_routines)}\n")
 
         if self.impact_limitations:
-            result += f"\n⬇️  Limites de Impacto: {', '.join(self.impact_limitations)}\n"
+            parts.append(f"\n⬇️  Limites de Impacto: {', '.join(self.impact_limitations)}\n")
 
         if self.feedback_required:
-            result += "\n💬 Feedback: Retornar sensações semanalmente para ajustes finos no plano.\n"
+            parts.append("\n💬 Feedback: Retornar sensações semanalmente para ajustes finos no plano.\n")
 
         # Recommendations
-        needs_mod, mods = self.needs_modified_plan()
         if needs_mod:
-            result += f"\n⚠️  Modificações Recomendadas:\n"
+            parts.append("\n⚠️  Modificações Recomendadas:\n")
             for mod in mods:
-                result += f"   • {mod}\n"
+                parts.append(f"   • {mod}\n")
+
+        parts.append(_PROFILE_FOOTER)
+
+        return "".join(parts)
 
-        result += "="*70 + "\n"
 
-        return result
+class UserProfileBatch:
+    """
+    Column-oriented (structure-of-arrays) view over many profiles for cohort analytics.
+
+    The numeric fields used by BMI and injury-risk calculations are stored as
+    NumPy arrays; the source profiles stay available in ``profiles`` for
+    everything else. Single-profile code should keep using ``UserProfile``.
+    """
+
+    def __init__(self, profiles: Sequence[UserProfile]):
+        import numpy as np  # only needed for batch analytics
+
+        self.profiles: Tuple[UserProfile, ...] = tuple(profiles)
+        self.weight_kg = np.array([p.weight_kg for p in self.profiles], dtype=np.float64)
+        self.height_cm = np.array([p.height_cm for p in self.profiles], dtype=np.float64)
+        self.age = np.array([p.age for p in self.profiles], dtype=np.int32)
+        self.years_running = np.array([p.years_running for p in self.profiles], dtype=np.float64)
+        self.current_weekly_km = np.array([p.current_weekly_km for p in self.profiles], dtype=np.float64)
+        self.has_current_injury = np.array([bool(p.current_injuries) for p in self.profiles], dtype=bool)
+        self.previous_injury_count = np.array([len(p.previous_injuries) for p in self.profiles], dtype=np.int32)
+
+    @classmethod
+    def from_profiles(cls, profiles: Sequence[UserProfile]) -> 'UserProfileBatch':
+        """Build the batch view from a sequence of profiles."""
+        return cls(profiles)
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def bmi(self):
+        """BMI per profile (rounded to 1 decimal, 0.0 when weight/height are missing)."""
+        import numpy as np
+
+        valid = (self.weight_kg > 0) & (self.height_cm > 0)
+        height_m = np.where(valid, self.height_cm / 100, 1.0)
+        return np.where(valid, np.round(self.weight_kg / height_m ** 2, 1), 0.0)
+
+    def risk_scores(self):
+        """Injury risk score per profile (same terms as _injury_risk_score)."""
+        return (
+            3 * self.has_current_injury
+            + 2 * (self.previous_injury_count > 2)
+            + 2 * (self.bmi() > 28)
+            + 2 * ((self.years_running < 2) & (self.current_weekly_km > 40))
+        )
+
+    def risk_levels(self) -> List[str]:
+        """Injury risk label per profile ("Baixo", "Moderado" or "Alto")."""
+        return [_RISK_LABELS[bisect_right(_RISK_CUTS, score)] for score in self.risk_scores().tolist()]
@@ -4,10 +4,31 @@ Contém sessões pré-definidas para cada categoria de treino.
 As sessões são selecionadas com base no nível do atleta e fase do treinamento.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Callable
+from typing import Collection, List, Dict, FrozenSet, Iterator, Mapping, Optional, Callable, Sequence, Tuple
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
 import random
+import sys
+
+
+# Dataclasses com slots (sem __dict__ por instância) quando suportado (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Gerador próprio da biblioteca para a seleção aleatória de sessões
+_rng = random.Random()
+
+
+def _intern(value):
+    """sys.intern para strings; outros valores passam intactos."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _segment(segment: Mapping[str, object]) -> Dict[str, object]:
+    """Cópia própria do segmento (dict simples), com as strings internadas."""
+    return {_intern(k): _intern(v) for k, v in segment.items()}
 
 
 class WorkoutCategory(Enum):
@@ -36,7 +57,18 @@ class AthleteLevel(Enum):
     ADVANCED = "advanced"
 
 
-@dataclass
+# Ordem dos níveis para comparações O(1) (evita list.index a cada chamada)
+_LEVEL_RANK = {
+    AthleteLevel.BEGINNER: 0,
+    AthleteLevel.INTERMEDIATE: 1,
+    AthleteLevel.ADVANCED: 2,
+}
+
+# Posição de cada fase (coluna da tabela WorkoutSession._suit)
+_PHASE_INDEX = {phase: i for i, phase in enumerate(TrainingPhase)}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class WorkoutSession:
     """
     Representa uma sessão de treino pré-definida.
@@ -48,8 +80,8 @@ class WorkoutSession:
         description: Descrição detalhada do treino
         emoji: Emoji representativo
         min_level: Nível mínimo requerido
-        phases: Fases do treinamento onde é apropriado
-        structure: Estrutura detalhada do treino
+        phases: Fases do treinamento onde é apropriado (convertidas para frozenset)
+        structure: Estrutura detalhada do treino (tupla de segmentos)
         duration_range: (min, max) duração em minutos
         distance_range: (min, max) distância em km
         intensity: Intensidade geral (1-10)
@@ -62,37 +94,61 @@ class WorkoutSession:
     description: str
     emoji: str
     min_level: AthleteLevel
-    phases: List[TrainingPhase]
-    structure: List[Dict]
+    phases: FrozenSet[TrainingPhase]
+    structure: Tuple[Dict[str, object], ...] = field(hash=False)  # dicts não são hasháveis
     duration_range: tuple
     distance_range: tuple
     intensity: int
-    benefits: List[str] = field(default_factory=list)
-    tips: List[str] = field(default_factory=list)
+    benefits: Tuple[str, ...] = ()
+    tips: Tuple[str, ...] = ()
+    # Tabela [rank do nível][posição da fase] -> adequada?, montada no primeiro is_suitable_for
+    _suit: Tuple[Tuple[bool, ...], ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Aceita listas nas definições, mas guarda tuplas/frozenset (frozenset dá
+        # "phase in phases" O(1)); segmentos ficam como dicts próprios, copiáveis
+        # e serializáveis.
+        # A instância é frozen, então a conversão usa object.__setattr__.
+        _set = object.__setattr__
+        # IDs internados: comparações em exclude_ids/_by_id viram checagem de identidade
+        _set(self, "id", sys.intern(self.id))
+        _set(self, "phases", frozenset(self.phases))
+        _set(self, "structure", tuple(_segment(segment) for segment in self.structure))
+        _set(self, "benefits", tuple(_intern(b) for b in self.benefits))
+        _set(self, "tips", tuple(_intern(t) for t in self.tips))
 
     def is_suitable_for(self, level: AthleteLevel, phase: TrainingPhase) -> bool:
         """Verifica se a sessão é adequada para o nível e fase."""
-        level_order = [AthleteLevel.BEGINNER, AthleteLevel.INTERMEDIATE, AthleteLevel.ADVANCED]
-        return (level_order.index(level) >= level_order.index(self.min_level)
-                and phase in self.phases)
+        suit = self._suit
+        if not suit:
+            min_rank = _LEVEL_RANK[self.min_level]
+            suit = tuple(
+                tuple(rank >= min_rank and ph in self.phases for ph in TrainingPhase)
+                for rank in range(len(_LEVEL_RANK))
+            )
+            object.__setattr__(self, "_suit", suit)
+        return suit[_LEVEL_RANK[level]][_PHASE_INDEX[phase]]
 
     def to_description(self, distance_km: float = None, duration_min: int = None) -> str:
         """Gera descrição formatada do treino."""
-        parts = [f"{self.emoji} {self.name}"]
-
+        # Valores vazios/zero são omitidos, como antes
+        if distance_km and duration_min:
+            return (f"{self.emoji} {self.name} | 📏 {distance_km:.1f}km | ⏱️ {duration_min}min"
+                    f"\n{self.description}")
         if distance_km:
-            parts.append(f"📏 {distance_km:.1f}km")
+            return f"{self.emoji} {self.name} | 📏 {distance_km:.1f}km\n{self.description}"
         if duration_min:
-            parts.append(f"⏱️ {duration_min}min")
-
-        return " | ".join(parts) + f"\n{self.description}"
+            return f"{self.emoji} {self.name} | ⏱️ {duration_min}min\n{self.description}"
+        return f"{self.emoji} {self.name}\n{self.description}"
 
 
 # =============================================================================
 # 🚶 SESSÕES EASY (Corrida Leve)
 # =============================================================================
 
-EASY_SESSIONS = [
+EASY_SESSIONS = (
     WorkoutSession(
         id="easy_01",
         name="Corrida Leve Básica",
@@ -181,14 +237,14 @@ EASY_SESSIONS = [
         benefits=["Ensina controle de ritmo", "Prepara para progressivos", "Simulação de corrida"],
         tips=["Progressão deve ser gradual", "Termine sentindo que poderia continuar"]
     ),
-]
+)
 
 
 # =============================================================================
 # 🏃‍♂️ SESSÕES LONG (Longão)
 # =============================================================================
 
-LONG_SESSIONS = [
+LONG_SESSIONS = (
     WorkoutSession(
         id="long_01",
         name="Longão Clássico",
@@ -300,14 +356,14 @@ LONG_SESSIONS = [
         benefits=["Manutenção da resistência", "Recuperação ativa", "Preparação mental"],
         tips=["Não acelere mesmo se sentir bem", "Foco em relaxamento"]
     ),
-]
+)
 
 
 # =============================================================================
 # 💨 SESSÕES INTERVAL (Intervalado)
 # =============================================================================
 
-INTERVAL_SESSIONS = [
+INTERVAL_SESSIONS = (
     WorkoutSession(
         id="interval_01",
         name="Intervalos Curtos 400m",
@@ -467,14 +523,14 @@ INTERVAL_SESSIONS = [
         benefits=["Velocidade progressiva", "Capacidade de acelerar cansado", "Simulação de sprint final"],
         tips=["Guarde energia para os últimos tiros", "O 400m final é all-out"]
     ),
-]
+)
 
 
 # =============================================================================
 # ⚡ SESSÕES TEMPO
 # =============================================================================
 
-TEMPO_SESSIONS = [
+TEMPO_SESSIONS = (
     WorkoutSession(
         id="tempo_01",
         name="Tempo Run Clássico",
@@ -532,14 +588,14 @@ TEMPO_SESSIONS = [
         benefits=["Controle de ritmo", "Capacidade de acelerar", "Simulação de negative split"],
         tips=["Primeira parte deve parecer fácil", "Termine forte mas não destruído"]
     ),
-]
+)
 
 
 # =============================================================================
 # 🧘 SESSÕES RECOVERY
 # =============================================================================
 
-RECOVERY_SESSIONS = [
+RECOVERY_SESSIONS = (
     WorkoutSession(
         id="recovery_01",
         name="Corrida de Recuperação",
@@ -575,7 +631,225 @@ RECOVERY_SESSIONS = [
         benefits=["Ativação muscular", "Soltar as pernas", "Preparação mental"],
         tips=["Não se preocupe com ritmo", "Strides são opcionais e curtos"]
     ),
-]
+)
+
+
+# =============================================================================
+# 🗂️ ÍNDICES (montados uma única vez, na primeira consulta)
+# =============================================================================
+
+_SESSIONS_BY_CATEGORY: Dict[WorkoutCategory, Tuple[WorkoutSession, ...]] = {
+    WorkoutCategory.EASY: EASY_SESSIONS,
+    WorkoutCategory.LONG: LONG_SESSIONS,
+    WorkoutCategory.INTERVAL: INTERVAL_SESSIONS,
+    WorkoutCategory.TEMPO: TEMPO_SESSIONS,
+    WorkoutCategory.RECOVERY: RECOVERY_SESSIONS,
+}
+
+# (categoria, nível, fase) -> sessões adequadas, na ordem da biblioteca
+_SUITABLE_INDEX: Dict[Tuple[WorkoutCategory, AthleteLevel, TrainingPhase], Tuple[WorkoutSession, ...]] = {}
+# (nível, fase) -> sessões adequadas de todas as categorias
+_SESSIONS_BY_LEVEL_PHASE: Dict[Tuple[AthleteLevel, TrainingPhase], Tuple[WorkoutSession, ...]] = {}
+_BY_ID: Dict[str, WorkoutSession] = {}
+_ALL_SESSIONS: Tuple[WorkoutSession, ...] = ()
+_SUMMARY: Dict[str, int] = {}
+
+# Layout em arrays paralelos (SoA) por categoria: nível mínimo como inteiro,
+# fases como bitmask e as referências às sessões, na mesma posição
+_PHASE_BIT: Dict[TrainingPhase, int] = {ph: 1 << i for ph, i in _PHASE_INDEX.items()}
+_MIN_LEVEL: Dict[WorkoutCategory, Tuple[int, ...]] = {}
+_PHASE_MASK: Dict[WorkoutCategory, Tuple[int, ...]] = {}
+_SESS_REFS: Dict[WorkoutCategory, Tuple[WorkoutSession, ...]] = {}
+
+
+def _phase_mask(phases: FrozenSet[TrainingPhase]) -> int:
+    mask = 0
+    for ph in phases:
+        mask |= _PHASE_BIT[ph]
+    return mask
+
+
+def _scan_suitable(
+    category: WorkoutCategory,
+    level: AthleteLevel,
+    phase: TrainingPhase
+) -> Tuple[WorkoutSession, ...]:
+    """Filtra a categoria percorrendo só os arrays de inteiros (sem acessar as sessões)."""
+    rank = _LEVEL_RANK[level]
+    bit = _PHASE_BIT[phase]
+    return tuple(
+        ref
+        for ref, min_level, mask in zip(_SESS_REFS[category], _MIN_LEVEL[category], _PHASE_MASK[category])
+        if min_level <= rank and mask & bit
+    )
+
+
+def _init() -> None:
+    """
+    Popula os índices a partir das tabelas de sessões.
+
+    Chamado na primeira consulta (guarda ``if not _ALL_SESSIONS``), não na
+    importação: quem só importa o módulo não paga a montagem. _ALL_SESSIONS é
+    atribuído por último, então a guarda só desliga com os índices completos.
+    """
+    global _ALL_SESSIONS, _SUMMARY
+
+    all_sessions = tuple(chain.from_iterable(_SESSIONS_BY_CATEGORY.values()))
+    _BY_ID.update((s.id, s) for s in all_sessions)
+    _SUMMARY = {cat.value: len(sessions) for cat, sessions in _SESSIONS_BY_CATEGORY.items()}
+
+    for category, sessions in _SESSIONS_BY_CATEGORY.items():
+        _SESS_REFS[category] = sessions
+        _MIN_LEVEL[category] = tuple(_LEVEL_RANK[s.min_level] for s in sessions)
+        _PHASE_MASK[category] = tuple(_phase_mask(s.phases) for s in sessions)
+
+    by_level_phase: Dict[Tuple[AthleteLevel, TrainingPhase], List[WorkoutSession]] = {}
+    for category in _SESSIONS_BY_CATEGORY:
+        for level in AthleteLevel:
+            for phase in TrainingPhase:
+                suitable = _scan_suitable(category, level, phase)
+                _SUITABLE_INDEX[(category, level, phase)] = suitable
+                if suitable:
+                    by_level_phase.setdefault((level, phase), []).extend(suitable)
+    # Tuplas: consumidores podem compartilhar os índices sem cópia
+    _SESSIONS_BY_LEVEL_PHASE.update((key, tuple(s)) for key, s in by_level_phase.items())
+    _ALL_SESSIONS = all_sessions
+
+
+# Arrays NumPy concatenando todas as categorias (na ordem de _ALL_SESSIONS),
+# montados no primeiro uso de find_across_categories
+_NP_TABLES = None
+
+
+def _numpy_tables():
+    global _NP_TABLES
+    if _NP_TABLES is None:
+        import numpy as np  # only needed for bulk filtering
+
+        if not _ALL_SESSIONS:
+            _init()
+        _NP_TABLES = (
+            np.fromiter(chain.from_iterable(_MIN_LEVEL.values()), dtype=np.uint8, count=len(_ALL_SESSIONS)),
+            np.fromiter(chain.from_iterable(_PHASE_MASK.values()), dtype=np.uint8, count=len(_ALL_SESSIONS)),
+        )
+    return _NP_TABLES
+
+
+def find_across_categories(level: AthleteLevel, phase: TrainingPhase) -> Tuple[WorkoutSession, ...]:
+    """
+    Sessões adequadas de todas as categorias via máscara NumPy vetorizada.
+
+    Mesmo resultado de get_sessions(level, phase); pensado para planejamento em
+    lote quando a biblioteca crescer para centenas de sessões. Requer numpy.
+    """
+    import numpy as np
+
+    min_level, phase_mask = _numpy_tables()
+    matches = np.flatnonzero((min_level <= _LEVEL_RANK[level]) & ((phase_mask & _PHASE_BIT[phase]) != 0))
+    return tuple(_ALL_SESSIONS[i] for i in matches.tolist())
+
+
+def get_sessions(
+    level: AthleteLevel,
+    phase: TrainingPhase,
+    category: Optional[WorkoutCategory] = None
+) -> Tuple[WorkoutSession, ...]:
+    """Retorna as sessões adequadas para o nível e fase (opcionalmente de uma categoria)."""
+    if not _ALL_SESSIONS:
+        _init()
+    if category is None:
+        return _SESSIONS_BY_LEVEL_PHASE.get((level, phase), ())
+    return _SUITABLE_INDEX.get((category, level, phase), ())
+
+
+def _candidate_pool(
+    category: WorkoutCategory,
+    level: AthleteLevel,
+    phase: TrainingPhase,
+    exclude_ids: Optional[Collection[str]]
+) -> Sequence[WorkoutSession]:
+    """Sessões elegíveis, com fallback para a categoria inteira."""
+    if not _ALL_SESSIONS:
+        _init()
+    suitable = _SUITABLE_INDEX.get((category, level, phase), ())
+    # Fallback: qualquer sessão da categoria (direto, se nenhuma for adequada)
+    pool = suitable or _SESSIONS_BY_CATEGORY.get(category, ())
+
+    # Caso comum (nada a excluir): usa direto a tupla pré-computada
+    if exclude_ids:
+        exclude_set = frozenset(exclude_ids)
+        candidates = [s for s in pool if s.id not in exclude_set]
+        if not candidates and pool is suitable:
+            # Todas as adequadas foram excluídas: tenta o restante da categoria
+            candidates = [s for s in _SESSIONS_BY_CATEGORY.get(category, ()) if s.id not in exclude_set]
+        pool = candidates
+
+    return pool
+
+
+def _iter_suitable(
+    category: WorkoutCategory,
+    level: AthleteLevel,
+    phase: TrainingPhase,
+    exclude_ids: Optional[Collection[str]] = None
+) -> Iterator[WorkoutSession]:
+    """
+    Percorre preguiçosamente as mesmas sessões de _candidate_pool, na mesma ordem.
+
+    Para seletores que só precisam da primeira ocorrência: nenhuma lista é montada
+    e a iteração para no primeiro resultado consumido.
+    """
+    if not _ALL_SESSIONS:
+        _init()
+    exclude_set = frozenset(exclude_ids) if exclude_ids else frozenset()
+    found = False
+    for s in _SUITABLE_INDEX.get((category, level, phase), ()):
+        if s.id not in exclude_set:
+            found = True
+            yield s
+    if not found:
+        for s in _SESSIONS_BY_CATEGORY.get(category, ()):
+            if s.id not in exclude_set:
+                yield s
+
+
+def select_first_session(
+    category: WorkoutCategory,
+    level: AthleteLevel,
+    phase: TrainingPhase,
+    exclude_ids: Optional[Collection[str]] = None
+) -> Optional[WorkoutSession]:
+    """Primeira sessão elegível, na ordem da biblioteca (seleção determinística)."""
+    return next(_iter_suitable(category, level, phase, exclude_ids), None)
+
+
+def select_session(
+    category: WorkoutCategory,
+    level: AthleteLevel,
+    phase: TrainingPhase,
+    exclude_ids: Optional[Collection[str]] = None
+) -> Optional[WorkoutSession]:
+    """
+    Seleciona uma sessão aleatória adequada para os parâmetros.
+
+    Args:
+        category: Categoria do treino
+        level: Nível do atleta
+        phase: Fase do treinamento
+        exclude_ids: IDs de sessões a excluir (para evitar repetição)
+
+    Returns:
+        Uma sessão de treino ou None se não houver disponível
+    """
+    pool = _candidate_pool(category, level, phase, exclude_ids)
+    return pool[_rng.randrange(len(pool))] if pool else None
+
+
+def get_session_by_id(session_id: str) -> Optional[WorkoutSession]:
+    """Busca uma sessão pelo ID."""
+    if not _ALL_SESSIONS:
+        _init()
+    return _BY_ID.get(session_id)
 
 
 # =============================================================================
@@ -586,95 +860,123 @@ class WorkoutLibrary:
     """
     Biblioteca central de todas as sessões de treino.
     Permite buscar e selecionar sessões por categoria, nível e fase.
+
+    Fachada sobre os índices do módulo (somente leitura); só o cursor do
+    seletor em rodízio é estado próprio de cada instância.
     """
 
     def __init__(self):
-        self.sessions: Dict[WorkoutCategory, List[WorkoutSession]] = {
-            WorkoutCategory.EASY: EASY_SESSIONS,
-            WorkoutCategory.LONG: LONG_SESSIONS,
-            WorkoutCategory.INTERVAL: INTERVAL_SESSIONS,
-            WorkoutCategory.TEMPO: TEMPO_SESSIONS,
-            WorkoutCategory.RECOVERY: RECOVERY_SESSIONS,
-        }
-
-    def get_sessions(self, category: WorkoutCategory) -> List[WorkoutSession]:
+        # Cópia rasa: os valores já são tuplas imutáveis compartilhadas com os índices
+        self.sessions: Dict[WorkoutCategory, Tuple[WorkoutSession, ...]] = dict(_SESSIONS_BY_CATEGORY)
+        # Cursores do seletor em rodízio, por (categoria, nível, fase)
+        self._rr_cursor: Dict[Tuple[WorkoutCategory, AthleteLevel, TrainingPhase], int] = defaultdict(int)
+
+    def get_sessions(self, category: WorkoutCategory) -> Tuple[WorkoutSession, ...]:
         """Retorna todas as sessões de uma categoria."""
-        return self.sessions.get(category, [])
+        return _SESSIONS_BY_CATEGORY.get(category, ())
 
     def get_suitable_sessions(
         self,
         category: WorkoutCategory,
         level: AthleteLevel,
         phase: TrainingPhase
-    ) -> List[WorkoutSession]:
+    ) -> Tuple[WorkoutSession, ...]:
         """Retorna sessões adequadas para o nível e fase especificados."""
-        sessions = self.get_sessions(category)
-        return [s for s in sessions if s.is_suitable_for(level, phase)]
+        return get_sessions(level, phase, category)
 
     def select_session(
         self,
         category: WorkoutCategory,
         level: AthleteLevel,
         phase: TrainingPhase,
-        exclude_ids: List[str] = None
+        exclude_ids: Optional[Collection[str]] = None
     ) -> Optional[WorkoutSession]:
-        """
-        Seleciona uma sessão aleatória adequada para os parâmetros.
+        """Seleciona uma sessão aleatória adequada (ver select_session do módulo)."""
+        return select_session(category, level, phase, exclude_ids)
 
-        Args:
-            category: Categoria do treino
-            level: Nível do atleta
-            phase: Fase do treinamento
-            exclude_ids: IDs de sessões a excluir (para evitar repetição)
+    def find_across_categories(self, level: AthleteLevel, phase: TrainingPhase) -> Tuple[WorkoutSession, ...]:
+        """Sessões adequadas de todas as categorias (filtro vetorizado, requer numpy)."""
+        return find_across_categories(level, phase)
 
-        Returns:
-            Uma sessão de treino ou None se não houver disponível
-        """
-        suitable = self.get_suitable_sessions(category, level, phase)
-
-        if exclude_ids:
-            suitable = [s for s in suitable if s.id not in exclude_ids]
+    def select_first_session(
+        self,
+        category: WorkoutCategory,
+        level: AthleteLevel,
+        phase: TrainingPhase,
+        exclude_ids: Optional[Collection[str]] = None
+    ) -> Optional[WorkoutSession]:
+        """Primeira sessão elegível, na ordem da biblioteca (seleção determinística)."""
+        return select_first_session(category, level, phase, exclude_ids)
 
-        if not suitable:
-            # Fallback: retorna qualquer sessão da categoria
-            suitable = self.get_sessions(category)
-            if exclude_ids:
-                suitable = [s for s in suitable if s.id not in exclude_ids]
+    def select_session_round_robin(
+        self,
+        category: WorkoutCategory,
+        level: AthleteLevel,
+        phase: TrainingPhase,
+        exclude_ids: Optional[Collection[str]] = None
+    ) -> Optional[WorkoutSession]:
+        """
+        Seleciona a próxima sessão em rodízio determinístico (sem sorteio).
 
-        return random.choice(suitable) if suitable else None
+        Cada combinação (categoria, nível, fase) tem seu próprio cursor, então
+        chamadas sucessivas percorrem as sessões adequadas sem repetir até dar a volta.
+        """
+        pool = _candidate_pool(category, level, phase, exclude_ids)
+        if not pool:
+            return None
+        key = (category, level, phase)
+        cursor = self._rr_cursor[key]
+        self._rr_cursor[key] = cursor + 1
+        return pool[cursor % len(pool)]
 
     def get_session_by_id(self, session_id: str) -> Optional[WorkoutSession]:
         """Busca uma sessão pelo ID."""
-        for sessions in self.sessions.values():
-            for session in sessions:
-                if session.id == session_id:
-                    return session
-        return None
+        return get_session_by_id(session_id)
 
-    def list_all_sessions(self) -> List[WorkoutSession]:
+    def list_all_sessions(self) -> Tuple[WorkoutSession, ...]:
         """Lista todas as sessões disponíveis."""
-        all_sessions = []
-        for sessions in self.sessions.values():
-            all_sessions.extend(sessions)
-        return all_sessions
+        if not _ALL_SESSIONS:
+            _init()
+        return _ALL_SESSIONS
 
     def get_session_summary(self) -> Dict[str, int]:
         """Retorna um resumo da quantidade de sessões por categoria."""
-        return {
-            cat.value: len(sessions)
-            for cat, sessions in self.sessions.items()
-        }
+        # Contagens fixas, calculadas com os índices; cópia para o chamador poder alterar
+        if not _ALL_SESSIONS:
+            _init()
+        return dict(_SUMMARY)
 
 
 # Instância global da biblioteca
 workout_library = WorkoutLibrary()
 
 
+# Valor -> membro, para converter nomes sem usar exceções como controle de fluxo
+_CATS = {c.value: c for c in WorkoutCategory}
+_LEVELS = {lvl.value: lvl for lvl in AthleteLevel}
+_PHASES = {ph.value: ph for ph in TrainingPhase}
+
+
+@lru_cache(maxsize=256)
+def _parse_session_key(
+    category: str,
+    level: str,
+    phase: str
+) -> Optional[Tuple[WorkoutCategory, AthleteLevel, TrainingPhase]]:
+    """Converte os nomes recebidos em enums (memoizado); None se algum for inválido."""
+    cat = _CATS.get(category.lower())
+    lvl = _LEVELS.get(level.lower())
+    ph = _PHASES.get(phase.lower())
+    if cat is None or lvl is None or ph is None:
+        return None
+    return cat, lvl, ph
+
+
 def get_workout_session(
     category: str,
     level: str = "intermediate",
     phase: str = "build",
-    exclude_ids: List[str] = None
+    exclude_ids: Optional[Collection[str]] = None
 ) -> Optional[WorkoutSession]:
     """
     Função de conveniência para obter uma sessão de treino.
@@ -688,13 +990,25 @@ def get_workout_session(
     Returns:
         WorkoutSession ou None
     """
-    try:
-        cat = WorkoutCategory(category.lower())
-        lvl = AthleteLevel(level.lower())
-        ph = TrainingPhase(phase.lower())
-        return workout_library.select_session(cat, lvl, ph, exclude_ids)
-    except (ValueError, KeyError):
+    parsed = _parse_session_key(category, level, phase)
+    if parsed is None:
         return None
+    cat, lvl, ph = parsed
+    return select_session(cat, lvl, ph, exclude_ids)
+
+
+def get_workout_session_enum(
+    category: WorkoutCategory,
+    level: AthleteLevel = AthleteLevel.INTERMEDIATE,
+    phase: TrainingPhase = TrainingPhase.BUILD,
+    exclude_ids: Optional[Collection[str]] = None
+) -> Optional[WorkoutSession]:
+    """
+    Variante de get_workout_session para quem já tem os enums.
+
+    Pula a conversão de strings (.lower() + busca); usada pelo gerador de planos.
+    """
+    return select_session(category, level, phase, exclude_ids)
 
 
 # =============================================================================